@@ -0,0 +1,199 @@
+import logging
+import re
+from typing import Dict, Optional, Union
+from selectolax.lexbor import LexborHTMLParser
+
+
+# Job page parsing for SeekScraper. Kept apart from the API module, and free of import side effects,
+# so the parser processes only have to import this file and selectolax
+logger = logging.getLogger(__name__)
+
+# Job type keywords in priority order: when a title holds several, the first one listed wins
+_JOB_TYPES = {
+    "data analyst": (0, "Data Analyst"),
+    "data engineer": (1, "Data Engineer"),
+    "engineer": (2, "Data Engineer"),
+    "business analyst": (3, "Business Analyst"),
+    "analytics analyst": (4, "Analytcis Engineer"),
+    "data scientist": (5, "Data Scientist"),
+    "report developer": (6, "Report Developer"),
+    "solutions architect": (7, "Solutions Architect"),
+}
+# One alternation finds every keyword in a single scan of the title (longest first so "data engineer" beats "engineer")
+_JOB_TYPE_RE = re.compile('|'.join(re.escape(keyword) for keyword in sorted(_JOB_TYPES, key=len, reverse=True)), re.IGNORECASE)
+
+
+class SeekJobParser:
+    """
+    Read the job fields from a Seek job page. SeekScraper builds on it
+    """
+
+    # Fields read straight from the job page: (key, data-automation value, fallback selector, default when missing)
+    DETAIL_FIELDS = (
+        ('job_title', 'job-detail-title', '.j1ww7nx7', "Title not found"),
+        ('company', 'advertiser-name', '.y735df0', "Company not found"),
+        ('job_description', 'jobAdDetails', '.YCeva_0', "Description not found"),
+    )
+
+    # Other selectors used on every job page, kept as constants so they aren't rebuilt per call
+    AUTOMATION_SELECTOR = '[data-automation]'
+    LOCATION_AUTOMATION = 'job-detail-location'
+    LOCATION_SELECTOR = '[data-automation="job-detail-location"]'
+    LOCATION_LINK_SELECTOR = 'a[class*="gepq850"]'
+    LOCATION_FALLBACK_SELECTOR = 'a[href*="/jobs/in-"][class*="gepq850"]'
+    DETAILS_PAGE_AUTOMATION = 'jobDetailsPage'
+
+    # A job page fetched over plain HTTP that lacks the title was rendered client side, so it's loaded in Selenium
+    JOB_PAGE_SENTINEL = '[data-automation="job-detail-title"], .j1ww7nx7'
+
+    #Helps sanitize the text extracted from the website, avoiding Unicode errors.
+    @staticmethod
+    def sanitize_text(text):
+            if not isinstance(text, str):
+                return str(text)
+
+    # Fast path: ASCII text, or text that already encodes cleanly as UTF-8, has no surrogates to replace
+            if text.isascii():
+                return text
+            try:
+                text.encode('utf-8')
+                return text
+            except UnicodeEncodeError:
+        # Replace surrogates and other characters UTF-8 can't encode in a single round-trip
+                return text.encode('utf-8', 'replace').decode('utf-8')
+            
+            
+    #Added a function to extract the location in the page
+    @classmethod
+    def extract_location(cls, tree, automation_nodes: Optional[Dict] = None):
+        """
+        Extract job location from HTML using the job-detail-location container
+        and the anchor tag inside it.
+        
+        Args:
+            tree: LexborHTMLParser tree of the job page
+            automation_nodes: First node of each data-automation value, when the page was already walked
+            
+        Returns:
+            str: The location text or "Location not found" if not found
+        """
+        # First try to find the container with data-automation="job-detail-location"
+        if automation_nodes is not None:
+            location_container = automation_nodes.get(cls.LOCATION_AUTOMATION)
+        else:
+            location_container = tree.css_first(cls.LOCATION_SELECTOR)
+        
+        if location_container:
+            # Look for the anchor tag inside the container
+            location_link = location_container.css_first(cls.LOCATION_LINK_SELECTOR)
+            if location_link:
+                return cls.sanitize_text(location_link.text().strip())
+            
+            # If no specific anchor found, try any anchor or the container text itself
+            location_link = location_container.css_first('a')
+            if location_link:
+                return cls.sanitize_text(location_link.text().strip())
+                
+            return cls.sanitize_text(location_container.text().strip())
+        
+        # Direct selector for the location anchor if container not found
+        location_link = tree.css_first(cls.LOCATION_FALLBACK_SELECTOR)
+        if location_link:
+            return cls.sanitize_text(location_link.text().strip())
+                
+        return "Location not found"
+
+
+    @classmethod
+    def parse_job_tree(cls, tree: LexborHTMLParser) -> Dict:
+        """
+        Read the job fields (title, company, description, location, posting time and job type)
+        from a parsed job page
+
+        Args:
+            tree: LexborHTMLParser tree of the job page
+
+        Returns:
+            Dictionary of the job fields, using the "not found" defaults for missing ones
+        """
+        job_details = {}
+
+        # Walk the page once, keeping the first node of each data-automation value, instead of
+        # running a separate selector query over the whole page for every field
+        automation_nodes = {}
+        for node in tree.css(cls.AUTOMATION_SELECTOR):
+            automation_nodes.setdefault(node.attributes.get('data-automation'), node)
+
+        # Extract title, company and description, trying the class selector only when the data-automation node is missing
+        for key, automation, fallback_selector, default in cls.DETAIL_FIELDS:
+            element = automation_nodes.get(automation)
+            if element is None:
+                element = tree.css_first(fallback_selector)
+            job_details[key] = cls.sanitize_text(element.text().strip()) if element is not None else default
+
+        #Extract Location
+        try:
+            job_details['job_location'] = cls.extract_location(tree, automation_nodes)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Location: %s", job_details['job_location'])
+        except Exception as e:
+            logger.warning("Error extracting location: %s", e)
+            job_details['job_location'] = "Location not found"
+            
+        # Extract posting time
+        try:
+            # Look for spans containing "Posted" text inside the job details container found above
+            details_page = automation_nodes.get(cls.DETAILS_PAGE_AUTOMATION)
+            posting_elements = details_page.css('span') if details_page is not None else ()
+            posting_time = "Posting time not found"
+            
+            for element in posting_elements: #for all the elements in the posting_comments vairable defined before, it will check if it has the posted word and any of the Time letters
+                text = element.text().strip()
+                if "Posted" in text and any(unit in text for unit in ["ago", "h", "d", "m"]): #if the posted element has it, it will return the extracted text
+                    posting_time = text
+                    break
+                     
+            job_details['posting_time'] = cls.sanitize_text(posting_time) #Now it will be added to the dictionary
+        except Exception as e:
+            job_details['posting_time'] = "Posting time not found"
+
+
+        try: 
+            job_details['job_type'] = cls.categorize_job_type(job_details['job_title'])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Job_type: %s", job_details['job_type'])
+        except Exception as e:
+            job_details['job_type'] = "unknown"
+
+        return job_details
+
+    #Build a job_type categorization for the different job_types
+    @staticmethod
+    def categorize_job_type(job_title: str) -> str:
+        """
+        Categorize job types based on the job title 
+
+        """
+        # Scan the title once for every keyword, then keep the highest priority one found
+        keywords = _JOB_TYPE_RE.findall(job_title)
+        if not keywords:
+            return "unknown"
+
+        return min(_JOB_TYPES[keyword.lower()] for keyword in keywords)[1]
+
+
+def parse_job_page(html: Union[str, bytes], require_title: bool = False) -> Optional[Dict]:
+    """
+    Parse a job page into its fields. Module level so the parser processes can unpickle it
+
+    Args:
+        html: Raw HTML of the job page
+        require_title: Return None when the page has no job title, i.e. it needs JavaScript to render
+
+    Returns:
+        Dictionary of the job fields, or None
+    """
+    tree = LexborHTMLParser(html)
+    if require_title and tree.css_first(SeekJobParser.JOB_PAGE_SENTINEL) is None:
+        return None
+    return SeekJobParser.parse_job_tree(tree)
@@ -291,29 +291,25 @@ app = FastAPI(
         return job_days <= limit_days
 
        
-    def job_title_conditional_filter(self, job_title:str, job_title_filter: Optional[str]) -> bool:
+    @staticmethod
+    def _title_matches(job_title_lower: str, search_words: Optional[tuple]) -> bool:
         """
-        Check if the job title contains the search term
+        Check if the job title contains every search word
 
         Args:
-            job_title: The job title to check
-            job_title_filter: The text to search for in the title
+            job_title_lower: The job title to check, already lowercased
+            search_words: Lowercased words of the title filter, split once per scrape (None means no filter)
             
         Returns:
-            Boolean indicating if the search term is found in the title
+            Boolean indicating if all the search words are found in the title
 
 
         """
-        if not job_title_filter:
+        if not search_words:
             return True
 
-        # Convert both to lowercase for case-insensitive comparison
-        job_title = job_title.lower()
-        # Split search term into individual words
-        search_words = job_title_filter.lower().split()
-        
         # Check if all search words appear in the job title
-        return all(word in job_title for word in search_words) 
+        return all(word in job_title_lower for word in search_words) 
 
 
     async def scrape_jobs(self, search_url: str, num_jobs: int = None, max_pages: int = None, posted_time_limit: str = None, job_title_filter: Optional[str] = None) -> List[Dict]:
@@ -338,6 +334,9 @@ app = FastAPI(
             jobs_scraped = 0
             current_url = search_url
 
+            # Split the title filter into lowercase words once instead of for every card
+            search_words = tuple(job_title_filter.lower().split()) if job_title_filter else None
+
             while True:
                 print(f"\nScraping page {current_page}")
                 
@@ -364,7 +363,7 @@ app = FastAPI(
                         job_title = title_element.text.strip()
                         
                         # Skip this job if it doesn't match the title filter
-                        if not self.job_title_conditional_filter(job_title, job_title_filter):
+                        if not self._title_matches(job_title.lower(), search_words):
                             print(f"Skipping job - title doesn't match filter: {job_title}")
                             continue                        
                         
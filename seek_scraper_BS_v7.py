@@ -1,35 +1,531 @@
 import aiohttp
 import asyncio
-import json
+import functools
+import logging
+import multiprocessing
+import orjson
 import re
 import time
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Dict, Optional, Tuple, Union
+from aiolimiter import AsyncLimiter
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urljoin, urlparse, parse_qsl, urlencode, urlunparse
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
-from pydantic import BaseModel, HttpUrl
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, HttpUrl
 import uvicorn
 import os
-from datetime import datetime
+from datetime import date, datetime
 import random
 
 #Import selenium package
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 import undetected_chromedriver as uc  # Consider adding this library
 
+from seek_job_parser import SeekJobParser, parse_job_page
+
+
+logger = logging.getLogger(__name__)
+# The app is usually started with the uvicorn CLI, which only sets up uvicorn's own loggers, so give the
+# root logger a handler on import. basicConfig is a no-op when logging is already configured
+logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+# Log level is configurable so per-job debug output stays off in production (e.g. LOG_LEVEL=DEBUG).
+# Unknown names fall back to INFO instead of failing the import
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+if not isinstance(logging.getLevelName(LOG_LEVEL), int):
+    LOG_LEVEL = "INFO"
+logger.setLevel(LOG_LEVEL)
+logging.getLogger(SeekJobParser.__module__).setLevel(LOG_LEVEL)
+
+
+# Days per posting time unit: m (minutes), h (hours) and d (days)
+_UNIT_DAYS = {'m': 1 / 1440.0, 'h': 1 / 24.0, 'd': 1.0}
+
+# Job id: the path segment after /job/
+_JOB_ID_RE = re.compile(r'/job/([^/?#]+)')
+
+# Charset declared in the page itself, read when the Content-Type one is unusable
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+# HTTP statuses worth retrying: rate limiting and transient upstream errors
+RETRYABLE_STATUSES = (429, 502, 503, 504)
+# Longest a request waits before it is retried or before a rate limited host is asked again, whatever the server asks for
+MAX_RETRY_DELAY = 30.0
+
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    """
+    Read the delay requested by the server in a Retry-After header, if any
+    """
+    value = headers.get('Retry-After') if headers else None
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError: # HTTP-date form, fall back to our own backoff
+        return None
+
+
+# Job details already scraped, keyed by (job_id, day scraped). Seek repeats jobs across pages and
+# across scrape runs, so a hit skips the whole detail page fetch and parse. Keying on the day makes
+# entries expire daily, since the "Posted 3d ago" text goes stale. Oldest entries are evicted first
+JOB_DETAIL_CACHE_SIZE = 4096
+_JOB_DETAIL_CACHE: "OrderedDict[Tuple[str, date], Dict]" = OrderedDict()
+
+
+def _get_cached_job(job_id: str) -> Optional[Dict]:
+    """
+    Return a copy of today's cached details for job_id, or None on a miss
+    """
+    key = (job_id, date.today())
+    job_details = _JOB_DETAIL_CACHE.get(key)
+    if job_details is None:
+        return None
+    _JOB_DETAIL_CACHE.move_to_end(key)
+    return dict(job_details)
+
+
+def _cache_job(job_id: str, job_details: Dict) -> None:
+    """
+    Store the details of a job, evicting the least recently used entry when the cache is full
+    """
+    key = (job_id, date.today())
+    _JOB_DETAIL_CACHE[key] = dict(job_details)
+    _JOB_DETAIL_CACHE.move_to_end(key)
+    if len(_JOB_DETAIL_CACHE) > JOB_DETAIL_CACHE_SIZE:
+        _JOB_DETAIL_CACHE.popitem(last=False)
+
+
+def _replace_file(path: str, data: bytes) -> None:
+    """
+    Write data to path atomically
+
+    The bytes are written to a temporary file first and then moved over the target with
+    os.replace, so readers never see a half written file.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _append_file(path: str, data: bytes) -> None:
+    """
+    Append data to the end of path
+    """
+    with open(path, 'ab') as f:
+        f.write(data)
+
+
+# All disk writes go through one writer task started by the app lifespan.
+# Queue items are (path, bytes) for appends and (path, None) for whole-file snapshots,
+# whose latest content waits in _PENDING_SNAPSHOTS so rapid updates to one file are coalesced.
+_WRITE_QUEUE: Optional[asyncio.Queue] = None
+_PENDING_SNAPSHOTS: Dict[str, bytes] = {}
+
+
+async def _file_writer():
+    """
+    Write queued snapshots and appends to disk one at a time, off the event loop
+    """
+    while True:
+        path, data = await _WRITE_QUEUE.get()
+        try:
+            if data is None:
+                await asyncio.to_thread(_replace_file, path, _PENDING_SNAPSHOTS.pop(path))
+            else:
+                await asyncio.to_thread(_append_file, path, data)
+        except OSError as e:
+            logger.error("Error writing %s: %s", path, e)
+        finally:
+            _WRITE_QUEUE.task_done()
+
+
+async def submit_write(path: str, data: bytes, append: bool = False):
+    """
+    Hand a write to the writer task and return straight away
+
+    Args:
+        path: File to write
+        data: Bytes to write
+        append: Append to the file instead of replacing its whole content
+    """
+    if _WRITE_QUEUE is None:
+        # No writer task running (e.g. the scraper is used outside the API), so write directly
+        await asyncio.to_thread(_append_file if append else _replace_file, path, data)
+    elif append:
+        _WRITE_QUEUE.put_nowait((path, data))
+    else:
+        # A snapshot still waiting for this path is simply replaced by the newer one
+        if path not in _PENDING_SNAPSHOTS:
+            _WRITE_QUEUE.put_nowait((path, None))
+        _PENDING_SNAPSHOTS[path] = data
+
+
+def retry_async(max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = MAX_RETRY_DELAY, honour_retry_after: bool = True):
+    """
+    Retry an aiohttp coroutine with jittered exponential backoff.
+
+    429/502/503/504 responses, connection errors and timeouts are retried, honouring
+    Retry-After when the server sends it (unless honour_retry_after is False because the
+    caller already waits for it, e.g. through HostRateLimiter). Any other HTTP error is
+    raised straight away. Callers can override the number of attempts with the max_retries keyword.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, max_retries: Optional[int] = None, **kwargs):
+            attempts = max_retries or max_attempts
+            for attempt in range(attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except aiohttp.ClientResponseError as e:
+                    if e.status not in RETRYABLE_STATUSES or attempt == attempts - 1:
+                        raise
+                    delay = _retry_after_seconds(e.headers) if honour_retry_after else None
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    if attempt == attempts - 1:
+                        raise
+                    delay = None
+
+                if delay is None:
+                    delay = base_delay * 2 ** attempt + random.random()
+                delay = min(delay, max_delay)
+                logger.warning("Attempt %d failed, retrying in %.1fs", attempt + 1, delay)
+                await asyncio.sleep(delay)
+        return wrapper
+    return decorator
+
+
+class ConcurrencyController:
+    """
+    Limit on in-flight requests that adapts to how the server responds (AIMD).
+
+    The limit grows by roughly one slot per window of requests answered faster than
+    target_latency and halves on a 429/5xx or a failed request. Used as an async context
+    manager in place of an asyncio.Semaphore.
+    """
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 32, target_latency: float = 2.0):
+        self.minimum = minimum
+        self.maximum = max(maximum, minimum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self, latency: float):
+        """Additive increase: one extra slot per int(limit) fast responses"""
+        if latency < self.target_latency and self.limit < self.maximum:
+            self.limit = min(self.maximum, self.limit + 1 / int(self.limit))
+
+    def on_error(self):
+        """Multiplicative decrease: halve the limit"""
+        self.limit = max(self.minimum, self.limit / 2)
+        logger.warning("Backing off, concurrency limit is now %d", int(self.limit))
+
+
+class HostRateLimiter:
+    """
+    Token bucket per host, paced further by the rate limit headers the host sends back.
+
+    Each host gets its own AsyncLimiter of max_rate requests per time_period. A Retry-After
+    header, or a *ratelimit-remaining* header that reached 0, pauses new requests to that
+    host until the server says capacity is back (the *ratelimit-reset* header, when present).
+    A pause never lasts more than max_pause seconds, so a huge header can't hang a scrape.
+    """
+    def __init__(self, max_rate: float, time_period: float = 1, max_pause: float = MAX_RETRY_DELAY):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.max_pause = max_pause
+        self._limiters: Dict[str, AsyncLimiter] = {}
+        self._resume_at: Dict[str, float] = {}
+
+    async def acquire(self, host: str):
+        """Wait for a token for host and for any pause the host asked for to expire"""
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            # AsyncLimiter can't hand out a token from a bucket smaller than one, so a rate below one
+            # request per period becomes one request per stretched period (0.5/s -> 1 every 2s)
+            if self.max_rate < 1:
+                limiter = AsyncLimiter(max_rate=1, time_period=self.time_period / self.max_rate)
+            else:
+                limiter = AsyncLimiter(max_rate=self.max_rate, time_period=self.time_period)
+            self._limiters[host] = limiter
+        await limiter.acquire()
+
+        delay = self._resume_at.get(host, 0.0) - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, host: str, headers):
+        """Read the rate limit headers of a response from host and pause the host if needed"""
+        pause = _retry_after_seconds(headers)
+        if pause is None:
+            remaining = reset = None
+            for key, value in headers.items():
+                key = key.lower()
+                if 'ratelimit-remaining' in key:
+                    remaining = value
+                elif 'ratelimit-reset' in key:
+                    reset = value
+            try:
+                if remaining is not None and float(remaining) <= 0:
+                    pause = float(reset) if reset else self.time_period
+                    if pause > 1e12: # Reset given as a Unix timestamp in milliseconds
+                        pause = pause / 1000 - time.time()
+                    elif pause > 1e9: # Reset given as a Unix timestamp rather than seconds
+                        pause -= time.time()
+            except ValueError:
+                pause = self.time_period
+
+        if pause and pause > 0:
+            pause = min(pause, self.max_pause)
+            self._resume_at[host] = max(self._resume_at.get(host, 0.0), time.monotonic() + pause)
+            logger.warning("Rate limited by %s, pausing requests for %.1fs", host, pause)
+
+
+def _create_session(limit: int = 64, limit_per_host: int = 32, timeout: int = 30, headers: Optional[Dict] = None) -> aiohttp.ClientSession:
+    """
+    Create an aiohttp session with a capped keep-alive connection pool and DNS caching
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+        ttl_dns_cache=300
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        trust_env=True
+    )
+
+
+# Browsers the scraper identifies as, picked at random
+USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5 Safari/605.1.15'
+]
+
+
+# Runs in the page and calls back with the serialized DOM once <body> exists (the document is past
+# the loading state), so waiting for the page and reading its HTML is a single WebDriver call
+_OUTER_HTML_WHEN_READY = """
+const done = arguments[arguments.length - 1];
+const send = () => done(document.documentElement.outerHTML);
+if (document.readyState !== 'loading') { send(); }
+else { document.addEventListener('DOMContentLoaded', send, {once: true}); }
+"""
+
+# Trackers, ads and static assets Chrome never needs to request, blocked through the DevTools protocol
+BLOCKED_URL_PATTERNS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*segment.io*", "*facebook.net*", "*hotjar.com*",
+    "*.png", "*.jpg", "*.gif", "*.svg", "*.webp", "*.woff*", "*.css",
+]
+
+# Warm Chrome drivers shared by every scrape, filled in the lifespan. Each slot holds (driver, pages loaded);
+# the driver is None until the slot is first used or after the driver was recycled
+DRIVER_POOL_SIZE = int(os.environ.get("DRIVER_POOL_SIZE", 2))
+DRIVER_MAX_PAGES = 200 # Chrome leaks memory over time, so a driver is restarted after this many pages
+DRIVER_ACQUIRE_TIMEOUT = float(os.environ.get("DRIVER_ACQUIRE_TIMEOUT", 60)) # Seconds a fetch waits for a free driver
+_DRIVER_POOL: Optional[asyncio.Queue] = None
+
+
+def _build_driver() -> webdriver.Chrome:
+    """
+    Start a headless Chrome web driver set up to avoid bot detection
+    """
+    # Set up the Chrome options
+    chrome_options = Options()
+    
+    chrome_options.add_argument('--ignore-certificate-errors')
+    chrome_options.add_argument('--allow-insecure-localhost')
+    chrome_options.add_argument('--ignore-ssl-errors=yes')
+    chrome_options.add_argument('--disable-web-security')
+
+    # Add headless option for server environments
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+
+    # Add additional privacy options to avoid detection
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+
+    # Only the HTML is parsed, so skip images, stylesheets and fonts and the background services
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+    })
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-translate")
+    chrome_options.add_argument("--mute-audio")
+
+    # driver.get returns at DOMContentLoaded instead of waiting for every subresource
+    chrome_options.page_load_strategy = 'eager'
+
+    # Set user agent - Picks randomly from the list
+    chrome_options.add_argument(f"user-agent={random.choice(USER_AGENTS)}")
+    
+    chromedriver_path = '/usr/local/bin/chromedriver'
+    
+    driver = webdriver.Chrome(
+        service=Service(chromedriver_path),
+        options=chrome_options
+        )
+        
+    # Set window size
+    driver.set_window_size(1920, 1080)
+
+    # Bound how long _OUTER_HTML_WHEN_READY may wait for the page
+    driver.set_script_timeout(30)
+    
+    # Execute JavaScript to mask WebDriver presence
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+    # Block BLOCKED_URL_PATTERNS at the network layer so no socket is opened for them
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+    return driver
+
+
+async def _acquire_driver(timeout: Optional[float] = None):
+    """
+    Take a driver slot from the pool, starting Chrome when the slot is empty
+
+    Args:
+        timeout: Seconds to wait for a free slot before raising asyncio.TimeoutError (None waits forever)
+
+    Returns:
+        Tuple of the driver and the number of pages it has loaded
+    """
+    driver, pages = await asyncio.wait_for(_DRIVER_POOL.get(), timeout)
+    if driver is None:
+        try:
+            driver = await asyncio.to_thread(_build_driver)
+        except Exception:
+            _DRIVER_POOL.put_nowait((None, 0))
+            raise
+        pages = 0
+    return driver, pages
+
+
+async def _release_driver(driver: webdriver.Chrome, pages: int):
+    """
+    Give a driver back to the pool, quitting it instead once it has loaded DRIVER_MAX_PAGES pages
+    (or when the pool is already shut down)
+    """
+    if driver is not None and (_DRIVER_POOL is None or pages >= DRIVER_MAX_PAGES):
+        try:
+            await asyncio.to_thread(driver.quit)
+        except Exception as e:
+            logger.warning("Error quitting Chrome driver: %s", e)
+        driver, pages = None, 0
+
+    if _DRIVER_POOL is not None:
+        _DRIVER_POOL.put_nowait((driver, pages))
+
+
+# Processes that parse job pages, so parsing isn't bound to the event loop's core. Workers are
+# replaced after PARSE_TASKS_PER_CHILD pages to keep their memory in check. 0 parses in the event loop
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", min(4, os.cpu_count() or 1)))
+PARSE_TASKS_PER_CHILD = 500
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _new_parse_pool() -> ProcessPoolExecutor:
+    """
+    Start the job page parser processes. spawn, since max_tasks_per_child isn't supported with fork
+    """
+    return ProcessPoolExecutor(
+        max_workers=PARSE_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=PARSE_TASKS_PER_CHILD
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Share one aiohttp session (and its connection pool), a pool of warm Chrome drivers and the job
+    page parser processes between every scrape and run the file writer task, closing them on shutdown
+    once pending writes are flushed
+    """
+    global _WRITE_QUEUE, _DRIVER_POOL, _PARSE_POOL
+    _WRITE_QUEUE = asyncio.Queue()
+    writer = asyncio.create_task(_file_writer())
+    app.state.session = _create_session(limit=128)
+
+    if PARSE_WORKERS > 0:
+        _PARSE_POOL = _new_parse_pool()
+
+    # Start the drivers up front so the first scrapes that need Selenium don't wait for Chrome.
+    # A driver that fails to start leaves its slot empty, to be retried on first use
+    _DRIVER_POOL = asyncio.Queue()
+    for _ in range(DRIVER_POOL_SIZE):
+        _DRIVER_POOL.put_nowait((None, 0))
+    warm_slots = await asyncio.gather(*(_acquire_driver() for _ in range(DRIVER_POOL_SIZE)), return_exceptions=True)
+    for slot in warm_slots:
+        if isinstance(slot, Exception):
+            logger.warning("Could not start a Chrome driver: %s", slot)
+        else:
+            _DRIVER_POOL.put_nowait(slot)
+
+    yield
+
+    await app.state.session.close()
+    await _WRITE_QUEUE.join()
+    writer.cancel()
+    _WRITE_QUEUE = None
+
+    if _PARSE_POOL is not None:
+        pool, _PARSE_POOL = _PARSE_POOL, None
+        await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+
+    pool, _DRIVER_POOL = _DRIVER_POOL, None
+    while not pool.empty():
+        driver, _ = pool.get_nowait()
+        if driver is not None:
+            await asyncio.to_thread(driver.quit)
+
 
 #Create the API APP
 app = FastAPI(
     title = "Seek Job Scraper API",
     description = "A simple API to scrape job listings from Seek.com.au",
-    version = "1.0.0"
+    version = "1.0.0",
+    lifespan = lifespan,
+    default_response_class = ORJSONResponse # Every endpoint serializes with orjson
 )
 
 #Define the data model for the job search
@@ -38,36 +534,53 @@ class JobSearchRequest(BaseModel):
     max_pages: Optional[int] = None
     posted_time_limit: Optional[str] = None
     num_jobs: Optional[int] = None
+    max_rate: Optional[float] = Field(None, gt=0) # Requests per second per host, e.g. 0.5 for one every 2s
+    fetch_description: bool = True
 
 
 #Create class for all the functions regarding scraping
-class SeekScraper:
+class SeekScraper(SeekJobParser):
+
+    # Search result page selectors
+    JOB_CARDS_SELECTOR = 'article[data-automation="normalJob"], [data-automation="jobCard"]'
+    JOB_LINK_SELECTOR = 'a[href*="/job/"]'
+    LISTING_DATE_SELECTOR = '[data-automation="jobListingDate"], span.listingDate'
+
+    # Fields a search result card already shows: (key, selector, default when missing)
+    CARD_FIELDS = (
+        ('job_title', '[data-automation="jobTitle"]', "Title not found"),
+        ('company', '[data-automation="jobCompany"]', "Company not found"),
+        ('job_location', '[data-automation="jobCardLocation"]', "Location not found"),
+        ('posting_time', LISTING_DATE_SELECTOR, "Posting time not found"),
+    )
     
-    def __init__(self, use_selenium=True):
+    def __init__(self, use_selenium=True, max_concurrency=32, max_rate=None, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize the scraper with base URL and headers for requests
 
         Args:
-            use_selenium: Boolean to determine to user selenium and not aiohttp
+            use_selenium: Fall back to Selenium for pages aiohttp can't fetch or that need JavaScript to render
+            max_concurrency: Upper bound for the adaptive number of pages fetched at the same time over aiohttp
+            max_rate: Maximum number of requests per second sent to each host (defaults to 8)
+            session: Shared aiohttp session to reuse. The scraper creates and closes its own when not given
         """
+        self.session = session
+        self.owns_session = session is None
         self.base_url = "https://www.seek.com.au" #Define the main URL that will be used
         self.use_selenium = use_selenium
         self.timeout = 30  # Timeout in seconds for HTTP requests
+        self.max_concurrency = max_concurrency
+        self.max_rate = max_rate or 8
         
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/115.0',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5 Safari/605.1.15'
-        ] # set the rotation of browesers
+        self.user_agents = USER_AGENTS # set the rotation of browesers
         
-        
-        if use_selenium:
-            self._setup_selenium()
-        else:
-            # Keep the aiohttp setup as backup
-            self.headers = {
+        # Outside the API the scraper starts its own Chrome driver the first time a page has to be loaded in Selenium
+        self.driver = None
+        self.driver_pages = 0
+
+        # Every page is fetched with aiohttp first. One user agent is kept for the scraper's lifetime,
+        # so the agent rotates per scrape rather than per request
+        self.headers = {
                 'User-Agent': random.choice(self.user_agents),
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
@@ -78,72 +591,41 @@ class SeekScraper:
                 'Sec-Fetch-Mode': 'navigate',
                 'Sec-Fetch-Site': 'none',
                 'Sec-Fetch-User': '?1'
-            }
-
-    def _setup_selenium(self):
-        """
-        Set up the Selenium web driver with Chrome
-        """
-        # Set up the Chrome options
-        chrome_options = Options()
-        
-        chrome_options.add_argument('--ignore-certificate-errors')
-        chrome_options.add_argument('--allow-insecure-localhost')
-        chrome_options.add_argument('--ignore-ssl-errors=yes')
-        chrome_options.add_argument('--disable-web-security')
-
-        # Add headless option for server environments
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-
-        # Add additional privacy options to avoid detection
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-
-
-        # Set user agent - Picks randomly from the list
-        chrome_options.add_argument(f"user-agent={random.choice(self.user_agents)}")
-        
-        chromedriver_path = '/usr/local/bin/chromedriver'
-        
-        self.driver = webdriver.Chrome(
-            service=Service(chromedriver_path),
-            options=chrome_options
-            )
-            
-        # Set window size
-        self.driver.set_window_size(1920, 1080)
-        
-        # Execute JavaScript to mask WebDriver presence
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")     
-        
+        }
 
     async def __aenter__(self): #This will open the session in the browser
                 
         """Set up resources when entering context"""
 
-        if not self.use_selenium:
-            # Only set up aiohttp if not using Selenium
-            self.session = aiohttp.ClientSession(headers=self.headers)
+        # Bound the number of in-flight aiohttp fetches, adapting the limit to Seek's responses
+        self.concurrency = self.max_concurrency
+        self.sem = ConcurrencyController(initial=min(4, self.concurrency), maximum=self.concurrency)
+
+        # The single Chrome driver can only load one page at a time
+        self.driver_lock = asyncio.Lock()
+
+        # Token bucket per host pacing every request, adjusted by the host's rate limit headers
+        self.limiter = HostRateLimiter(max_rate=self.max_rate, time_period=1)
+
+        if self.owns_session:
+            # Only set up aiohttp if no shared session was given
+            self.session = _create_session(timeout=self.timeout, headers=self.headers)
             
             # Make an initial request to get cookies
             try:
                 async with self.session.get(self.base_url) as response:
                     if response.status == 200:
-                        print("Successfully initialized session with cookies")
+                        logger.info("Successfully initialized session with cookies")
             except Exception as e:
-                print(f"Error initializing session: {str(e)}")
+                logger.warning("Error initializing session: %s", e)
                 
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb): #this will close the session 
         """Clean up resources when exiting context"""
-        if self.use_selenium:
-            self.driver.quit()
-        else:
+        if self.driver is not None:
+            await asyncio.to_thread(self.driver.quit)
+        if self.owns_session:
             await self.session.close()
 
     def extract_job_id(self, url: str) -> str: #defines the function with the variable self and the needed url (this URL contains the job_id)
@@ -156,159 +638,205 @@ class SeekScraper:
         Returns:
             The job ID extracted from the URL
         """
-        try: #uses try loop
-            # Find the part after 'job/' and before '?'
-            start_index = url.find('/job/') + 5  # +5 to skip '/job/' this function looks for the word '/job/' and adds 5 more spaces to get to the job_id
-            end_index = url.find('?', start_index) #defines the end of the job_id
-            
-            if end_index == -1:  # If there's no '?', take until the end
-                return url[start_index:]
-            return url[start_index:end_index]
-        
-        except Exception as e:
-            return "Job ID not found"
+        # One scan for the segment after '/job/', stopping at '/', '?' or '#'
+        match = _JOB_ID_RE.search(url)
+        return match.group(1) if match else "Job ID not found"
 
-    async def fetch_page(self, url: str, max_retries: int = 3) -> BeautifulSoup:
+    def _absolute_url(self, href: str) -> str:
         """
-        Fetch a webpage and return a BeautifulSoup object using either Selenium or aiohttp
+        Resolve a link from a Seek page against the base URL
+
+        Seek links are absolute or root-relative, so those are handled with plain string checks;
+        anything else goes through urljoin
         """
-        if self.use_selenium:
-            return await self._fetch_with_selenium(url, max_retries)
-        else:
-            return await self._fetch_with_aiohttp(url, max_retries)
-        
+        if href.startswith('/') and not href.startswith('//'):
+            return self.base_url + href
+        if href.startswith(('https://', 'http://')):
+            return href
+        return urljoin(self.base_url, href)
 
-    async def _fetch_with_selenium(self, url: str, max_retries: int = 3) -> BeautifulSoup:
+    async def fetch_page(self, url: str, max_retries: int = 3, sentinel: Optional[str] = None) -> LexborHTMLParser:
         """
-        Fetch a webpage using Selenium
+        Fetch a webpage and return a selectolax (lexbor) tree
+
+        The page is fetched with aiohttp first. It's loaded again in Selenium (when enabled) if that
+        fails or if the sentinel selector is missing from the static HTML, i.e. the page needs JavaScript
         """
-        for attempt in range(max_retries):
+        tree, _ = await self._fetch_tree(url, max_retries, sentinel)
+        return tree
+
+    async def _fetch_tree(self, url: str, max_retries: int = 3, sentinel: Optional[str] = None) -> Tuple[LexborHTMLParser, bool]:
+        """
+        fetch_page, also telling whether the page had to be rendered in Selenium
+
+        Returns:
+            Tuple of the tree (None if every fetch failed) and whether it came from Selenium
+        """
+        html = await self._fetch_html(url, max_retries)
+        tree = LexborHTMLParser(html) if html is not None else None
+        if not self.use_selenium or (tree is not None and (sentinel is None or tree.css_first(sentinel) is not None)):
+            return tree, False
+
+        logger.info("Loading %s in Selenium", url)
+        html = await self._fetch_with_selenium(url, max_retries)
+        if html is None:
+            return tree, False
+        return LexborHTMLParser(html), True
+
+    async def _fetch_html(self, url: str, max_retries: int = 3) -> Union[str, bytes]:
+        """
+        Fetch the raw HTML of a webpage with aiohttp (usually undecoded bytes), or None if it failed
+        """
+        async with self.sem:
+            started = time.monotonic()
             try:
-                # Execute in an asyncio executor to avoid blocking
-                loop = asyncio.get_event_loop()
-                
-                # Load the page
-                await loop.run_in_executor(None, lambda: self.driver.get(url))
-                
-                # Add a random delay to simulate human behavior
-                await asyncio.sleep(random.uniform(2, 4))
-                
-                # Wait for the page content to load 
-                await loop.run_in_executor(
-                    None, 
-                    lambda: WebDriverWait(self.driver, self.timeout).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
-                )
-                
-                # Get page source
-                html = await loop.run_in_executor(None, lambda: self.driver.page_source)
-                
-                # Parse with BeautifulSoup
-                return BeautifulSoup(html, 'html.parser')
-                
-            except TimeoutException:
-                print(f"Timeout on attempt {attempt + 1} for {url}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                
-            except WebDriverException as e:
-                print(f"WebDriver error on attempt {attempt + 1} for {url}: {str(e)}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                    
-                    # Refresh the WebDriver if we encounter issues
-                    if "ERR_INTERNET_DISCONNECTED" in str(e) or "invalid session id" in str(e):
-                        self.driver.quit()
-                        self._setup_selenium()
-                        
-            except Exception as e:
-                print(f"Unexpected error on attempt {attempt + 1} for {url}: {str(e)}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                html = await self._fetch_with_aiohttp(url, max_retries=max_retries)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # 429/5xx responses already backed off in _fetch_with_aiohttp
+                if not isinstance(e, aiohttp.ClientResponseError):
+                    self.sem.on_error()
+                logger.warning("Failed to fetch %s: %s", url, e)
+                return None
+
+            self.sem.on_success(time.monotonic() - started)
+            return html
         
-        print(f"Failed to fetch {url} after {max_retries} attempts")
-        return None    
 
-    async def _fetch_with_aiohttp(self, url: str, max_retries: int = 3) -> BeautifulSoup:
+    async def _fetch_with_selenium(self, url: str, max_retries: int = 3) -> str:
         """
-        Fetch a webpage using aiohttp (kept as a fallback)
+        Fetch a webpage using Selenium. Inside the API a driver is taken from the pool for this page only,
+        waiting at most DRIVER_ACQUIRE_TIMEOUT seconds, so a scrape never holds a driver between fallbacks.
+        Outside it the scraper starts its own driver on first use. driver_lock makes concurrent callers take turns
         """
-        for attempt in range(max_retries):
+        async with self.driver_lock:
+            pooled = _DRIVER_POOL is not None
             try:
-                # Update headers with random user agent
-                self.session.headers.update({'User-Agent': random.choice(self.user_agents)})
-                
-                async with self.session.get(url, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        return BeautifulSoup(html, 'html.parser')
-                    elif response.status == 403:
-                        print(f"Received 403 Forbidden. Waiting before retry.")
-                        wait_time = 2 ** attempt  # Exponential backoff
-                        await asyncio.sleep(wait_time)
-                    else:
-                        print(f"Error fetching {url}: HTTP {response.status}")
-            except Exception as e:
-                print(f"Attempt {attempt + 1} failed: {str(e)}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2)
+                if pooled:
+                    driver, pages = await _acquire_driver(timeout=DRIVER_ACQUIRE_TIMEOUT)
                 else:
-                    print(f"Failed after {max_retries} attempts")
-                    raise
-        return None
-
-
+                    if self.driver is None:
+                        self.driver = await asyncio.to_thread(_build_driver)
+                    driver, pages = self.driver, self.driver_pages
+            except asyncio.TimeoutError:
+                logger.warning("No Chrome driver free after %ss, skipping %s", DRIVER_ACQUIRE_TIMEOUT, url)
+                return None
+            except Exception as e:
+                logger.error("Could not start the Selenium driver: %s", e)
+                return None
 
-    #Helps sanitize the text extracted from the website, avoiding Unicode errors.
-    def sanitize_text(self, text):
-            if not isinstance(text, str):
-                return str(text)
-        
-    # Replace surrogate pairs and other problematic characters
             try:
-        # First attempt: encode with surrogateescape and decode back
-                return text.encode('utf-8', 'surrogateescape').decode('utf-8', 'replace')
-            except UnicodeError:
-        # Second attempt: more aggressive replacement
-                return text.encode('utf-8', 'replace').decode('utf-8')
-            
+                for attempt in range(max_retries):
+                    try:
+                        # Execute in an asyncio executor to avoid blocking
+                        loop = asyncio.get_event_loop()
+                    
+                        # Load the page
+                        await self.limiter.acquire(urlparse(url).netloc)
+                        await loop.run_in_executor(None, lambda: driver.get(url))
+                        pages += 1
+                    
+                        # Add a random delay to simulate human behavior
+                        await asyncio.sleep(random.uniform(2, 4))
+                    
+                        # Wait for the page content to load and get the serialized DOM in the same script call
+                        return await loop.run_in_executor(
+                            None, lambda: driver.execute_async_script(_OUTER_HTML_WHEN_READY)
+                        )
+                    
+                    except TimeoutException:
+                        logger.warning("Timeout on attempt %d for %s", attempt + 1, url)
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                    
+                    except WebDriverException as e:
+                        logger.warning("WebDriver error on attempt %d for %s: %s", attempt + 1, url, e)
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep(2 ** attempt)
+                        
+                            # Refresh the WebDriver if we encounter issues
+                            if "ERR_INTERNET_DISCONNECTED" in str(e) or "invalid session id" in str(e):
+                                # Off the event loop, so other scrapes keep running while Chrome restarts
+                                try:
+                                    await asyncio.to_thread(driver.quit)
+                                except Exception as quit_error:
+                                    logger.warning("Error quitting Chrome driver: %s", quit_error)
+                                driver, pages = None, 0
+                                try:
+                                    driver = await asyncio.to_thread(_build_driver)
+                                except Exception as build_error:
+                                    # The slot goes back empty, so the pool starts a new driver on its next use
+                                    logger.error("Could not restart the Selenium driver: %s", build_error)
+                                    break
+                            
+                    except Exception as e:
+                        logger.warning("Unexpected error on attempt %d for %s: %s", attempt + 1, url, e)
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep(2 ** attempt)
             
-    #Added a function to extract the location in the page
-    def extract_location(self, soup):
+                logger.warning("Failed to fetch %s after %d attempts", url, max_retries)
+                return None
+            finally:
+                if pooled:
+                    await _release_driver(driver, pages)
+                else:
+                    self.driver, self.driver_pages = driver, pages
+
+    # Retry-After is already waited for in self.limiter.acquire, so the retry only adds its own backoff
+    @retry_async(max_attempts=3, honour_retry_after=False)
+    async def _fetch_with_aiohttp(self, url: str) -> Union[str, bytes]:
         """
-        Extract job location from HTML using the job-detail-location container
-        and the anchor tag inside it.
-        
-        Args:
-            soup: BeautifulSoup object of the job page
-            
-        Returns:
-            str: The location text or "Location not found" if not found
+        Fetch a webpage using aiohttp (the fast path for every page)
+
+        Error responses raise aiohttp.ClientResponseError so retry_async can decide whether to retry
         """
-        # First try to find the container with data-automation="job-detail-location"
-        location_container = soup.select_one('[data-automation="job-detail-location"]')
-        
-        if location_container:
-            # Look for the anchor tag inside the container
-            location_link = location_container.select_one('a[class*="gepq850"]')
-            if location_link:
-                return self.sanitize_text(location_link.text.strip())
-            
-            # If no specific anchor found, try any anchor or the container text itself
-            location_link = location_container.select_one('a')
-            if location_link:
-                return self.sanitize_text(location_link.text.strip())
-                
-            return self.sanitize_text(location_container.text.strip())
-        
-        # Direct selector for the location anchor if container not found
-        location_link = soup.select_one('a[href*="/jobs/in-"][class*="gepq850"]')
-        if location_link:
-            return self.sanitize_text(location_link.text.strip())
-                
-        return "Location not found"
+        # Headers are sent per request since the session may be shared
+        host = urlparse(url).netloc
+        await self.limiter.acquire(host)
+        async with self.session.get(url, headers=self.headers) as response:
+            self.limiter.update(host, response.headers)
+            if response.status in RETRYABLE_STATUSES:
+                self.sem.on_error()
+            response.raise_for_status()
+            # Lexbor parses UTF-8 bytes directly, so the body is only decoded when Seek declares another charset
+            raw = await response.read()
+            charset = response.charset
+            if charset and charset.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+                try:
+                    return raw.decode(charset, errors='replace')
+                except LookupError:
+                    # A charset Python doesn't know. Lexbor reads bytes as UTF-8, so decode here: with the
+                    # page's <meta charset> when that one is known, else as UTF-8 with replacement characters
+                    logger.warning("Unknown charset %s for %s", charset, url)
+                    meta = _META_CHARSET_RE.search(raw, 0, 2048)
+                    if meta:
+                        try:
+                            return raw.decode(meta.group(1).decode('ascii'), errors='replace')
+                        except LookupError:
+                            pass
+                    return raw.decode('utf-8', errors='replace')
+            return raw
+
+
+
+    async def _parse_job_html(self, html: Union[str, bytes], require_title: bool = False) -> Optional[Dict]:
+        """
+        Parse a job page in the parser process pool, or inline when no pool is running (outside the API)
 
+        A pool broken by a dead worker (e.g. OOM-killed) is replaced, and the page is parsed inline meanwhile
+        """
+        global _PARSE_POOL
+        pool = _PARSE_POOL
+        if pool is None:
+            return parse_job_page(html, require_title)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, parse_job_page, html, require_title)
+        except BrokenProcessPool as e:
+            logger.error("Parser process pool broke, starting a new one: %s", e)
+            # Only the first caller to see this pool break replaces it
+            if _PARSE_POOL is pool:
+                _PARSE_POOL = _new_parse_pool()
+                pool.shutdown(wait=False, cancel_futures=True)
+            return parse_job_page(html, require_title)
 
     #Extraction of the job details
     async def extract_job_details(self, job_url: str) -> Dict: #once we have the job_url (defined later), the function will extract the details and added to a dictionary
@@ -323,120 +851,51 @@ class SeekScraper:
         """
         #the dictionary will be called job_details
         try:
+            job_id = self.extract_job_id(job_url)
+
+            # A job seen before (on another page or in an earlier scrape) is served from the cache
+            cached = _get_cached_job(job_id)
+            if cached is not None:
+                cached['url'] = job_url
+                return cached
+
             job_details = {
                 'url': job_url, 
-                'job_id': self.extract_job_id(job_url)
+                'job_id': job_id
             } #this first sentence will add the job_url to fetch de job page and the job id that is embeded in the url
             
-            # Fetch and parse the job page
-            soup = await self.fetch_page(job_url) #this will parse the whole page and if its not a soup object, it will return None
-            if not soup:
+            # Fetch the job page and parse it in the parser processes
+            html = await self._fetch_html(job_url)
+            page_fields = await self._parse_job_html(html, require_title=self.use_selenium) if html is not None else None
+            if page_fields is None and self.use_selenium:
+                # The fetch failed or the static HTML has no job title (rendered client side), so load it in Selenium
+                logger.info("Loading %s in Selenium", job_url)
+                rendered_html = await self._fetch_with_selenium(job_url)
+                if rendered_html is not None:
+                    page_fields = await self._parse_job_html(rendered_html)
+                elif html is not None:
+                    page_fields = await self._parse_job_html(html)
+            if page_fields is None:
                 return None
-                
-            # Extract job title
-            try:
-                title_element = soup.select_one('[data-automation="job-detail-title"], .j1ww7nx7')
-                job_details['job_title'] = self.sanitize_text(title_element.text.strip() if title_element else "Title not found")
-            except Exception as e:
-                job_details['job_title'] = "Title not found"
-
-            #Extract Location
-            try:
-                job_details['job_location'] = self.extract_location(soup)
-                print(f"Location: {job_details['job_location']}")
-            except Exception as e:
-                print(f"Error extracting location: {str(e)}")
-                job_details['job_location'] = "Location not found"
-            
-                
-            # Extract company name
-            try:
-                company_element = soup.select_one('[data-automation="advertiser-name"], .y735df0')
-                job_details['company'] = self.sanitize_text(company_element.text.strip() if company_element else "Company not found")
-            except Exception as e:
-                job_details['company'] = "Company not found"
-              
-                
-            # Extract job requirements/description
-            try:
-                description_element = soup.select_one('[data-automation="jobAdDetails"], .YCeva_0')
-                job_details['job_description'] = self.sanitize_text(description_element.text.strip() if description_element else "Description not found")
-            except Exception as e:
-                job_details['job_description'] = "Description not found"
-                
-            # Extract posting time
-            try:
-                # Look for spans containing "Posted" text
-                posting_elements = soup.select('[data-automation="jobDetailsPage"] span')
-                posting_time = "Posting time not found"
-                
-                for element in posting_elements: #for all the elements in the posting_comments vairable defined before, it will check if it has the posted word and any of the Time letters
-                    text = element.text.strip()
-                    if "Posted" in text and any(unit in text for unit in ["ago", "h", "d", "m"]): #if the posted element has it, it will return the extracted text
-                        posting_time = text
-                        break
-                         
-                job_details['posting_time'] = posting_time #Now it will be added to the dictionary
-            except Exception as e:
-                job_details['posting_time'] = "Posting time not found"
+            job_details.update(page_fields)
 
-
-            try: 
-                job_details['job_type'] = self.categorize_job_type(job_details['job_title'])
-                print(f"Job_type: {job_details['job_type']}")
-            except Exception as e:
-                job_details['job_type'] = "unknown"
+            if job_id != "Job ID not found":
+                _cache_job(job_id, job_details)
 
             return job_details #returns the dictionary after finishing the extraction 
 
         except Exception as e:
-            print(f"Error extracting job details: {str(e)}")
+            logger.error("Error extracting job details: %s", e)
             return None
 
     
-    #Build a job_type categorization for the different job_types
-    def categorize_job_type(self, job_title: str) -> str:
-        """
-        Categorize job types based on the job title 
-
-        """
-        job_title_lower = job_title.lower()
-
-        #check for DA
-        if "data analyst" in job_title_lower:
-            return "Data Analyst"
-        
-        if "data engineer" in job_title_lower:
-            return "Data Engineer"
-        
-        if "engineer" in job_title_lower:
-            return "Data Engineer"
-        
-        if "business analyst" in job_title_lower:
-            return "Business Analyst"   
-        
-        if "analytics analyst" in job_title_lower:
-            return "Analytcis Engineer" 
-        
-        if "data scientist" in job_title_lower:
-            return "Data Scientist" 
-        
-        if "report developer" in job_title_lower:
-            return "Report Developer" 
-        
-        if "solutions architect" in job_title_lower:
-            return "Solutions Architect" 
-        
-        return "unknown"
-
-
     #This function will get the next page URL
-    async def get_next_page_url(self, soup: BeautifulSoup, current_page: int) -> str:
+    async def get_next_page_url(self, tree: LexborHTMLParser, current_page: int) -> str:
         """
         Get the URL for the next page of search results
         
         Args:
-            soup: BeautifulSoup object of the current page
+            tree: LexborHTMLParser tree of the current page
             current_page: Current page number
             
         Returns:
@@ -446,19 +905,21 @@ class SeekScraper:
             next_page_num = current_page + 1
             
             # Look for the next page link
-            next_page_element = soup.select_one(f'[data-automation="page-{next_page_num}"]')
+            next_page_element = tree.css_first(f'[data-automation="page-{next_page_num}"]')
+            href = next_page_element.attributes.get('href') if next_page_element is not None else None
             
-            if next_page_element and next_page_element.has_attr('href'):
-                href = next_page_element['href']
-                return urljoin(self.base_url, href)
+            if href:
+                return self._absolute_url(href)
                 
             return None
             
         except Exception as e:
-            print(f"Error getting next page URL: {str(e)}")
+            logger.warning("Error getting next page URL: %s", e)
             return None
 
-    def _convert_to_days(self, posting_time: str) -> float:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _convert_to_days(posting_time: str) -> float:
         """
         Convert posting time string to number of days
         
@@ -468,41 +929,48 @@ class SeekScraper:
         Returns:
             Float representing the number of days
         """
-        print(f"\nConverting posting time: {posting_time}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Converting posting time: %s", posting_time)
         
         try:
-            if not posting_time or 'not found' in posting_time:
-                print("Invalid posting time, returning infinity")
+            # Sentinels and strings without any digit can never parse, so bail out before lowercasing and scanning
+            if not posting_time or 'not found' in posting_time or not any(c.isdigit() for c in posting_time):
+                if debug:
+                    logger.debug("Invalid posting time, returning infinity")
                 return float('inf')
             
-            # Remove "Posted" prefix and clean the string
-            cleaned_posted_time = posting_time.lower().replace('posted', '').strip()
-            print(f"Cleaned time string: {cleaned_posted_time}")
-
-            # Match a number followed by m (minutes), h (hours), or d (days)
-            match = re.match(r'(\d+)\s*([mhd])', cleaned_posted_time)
-            if not match:
-                print(f"Could not parse time format: {cleaned_posted_time}")
+            # Read the number and the unit letter that follows it (e.g. "posted 2d ago" -> 2, 'd'). The number
+            # must open the string, after an optional "posted"/"listed" word, so dates such as "Posted on 12 March"
+            # don't parse. The strings are tiny, so a plain character scan is cheaper than running a regex
+            text = posting_time.lower().lstrip()
+            for prefix in ('posted', 'listed'):
+                if text.startswith(prefix):
+                    text = text[len(prefix):].lstrip()
+                    break
+            length = len(text)
+
+            start = 0
+            end = start
+            while end < length and text[end].isdigit():
+                end += 1
+            unit_index = end
+            while unit_index < length and text[unit_index].isspace():
+                unit_index += 1
+
+            days_per_unit = _UNIT_DAYS.get(text[unit_index:unit_index + 1])
+            if start == end or days_per_unit is None:
+                if debug:
+                    logger.debug("Could not parse time format: %s", posting_time)
                 return float('inf')
-                        
-            value, unit = match.groups()
-            value = float(value)
-                    
-            # Convert to days based on unit
-            if unit == 'm':
-                days = value / (24 * 60)
-                print(f"Converting {value} minutes to {days:.2f} days")
-            elif unit == 'h':
-                days = value / 24
-                print(f"Converting {value} hours to {days:.2f} days")
-            else:  # unit == 'd'
-                days = value
-                print(f"Already in days: {days}")
-                        
+
+            days = int(text[start:end]) * days_per_unit
+            if debug:
+                logger.debug("Converted %s to %.2f days", posting_time, days)
             return days
                     
         except Exception as e:
-            print(f"Error converting time: {str(e)}")
+            logger.warning("Error converting time: %s", e)
             return float('inf')
     
     def _is_within_time_limit(self, posting_time: str, time_limit: str) -> bool:
@@ -522,106 +990,340 @@ class SeekScraper:
         job_days = self._convert_to_days(posting_time)
         limit_days = self._convert_to_days(time_limit)
         
-        print(f"Comparing job time ({job_days:.2f} days) with limit ({limit_days:.2f} days)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Comparing job time (%.2f days) with limit (%.2f days)", job_days, limit_days)
         return job_days < limit_days
 
+    def _card_outside_time_limit(self, card, time_limit: str) -> bool:
+        """
+        Check the listing date shown on a search result card against the time limit
 
-    async def scrape_jobs(self, search_url: str, num_jobs: int = None, max_pages: int = None, posted_time_limit: str = None) -> List[Dict]:
+        Args:
+            card: LexborNode of the job card
+            time_limit: String representing the maximum age of posts to include
+
+        Returns:
+            True only if the card shows a listing date and it is outside the time limit.
+            Cards without a readable date return False so their detail page is still checked
         """
-        Scrape job listings from Seek based on search criteria
-        
+        date_element = card.css_first(self.LISTING_DATE_SELECTOR)
+        if date_element is None:
+            return False
+
+        card_days = self._convert_to_days(date_element.text().strip())
+        return card_days != float('inf') and card_days >= self._convert_to_days(time_limit)
+
+
+    async def _extract_with_retries(self, job_url: str, max_attempts: int = 3) -> Dict:
+        """
+        Extract the details of a job, retrying when the extraction fails
+
         Args:
-            search_url: Initial search URL
-            num_jobs: Maximum number of jobs to scrape (optional)
-            max_pages: Maximum number of pages to scrape (optional)
-            posted_time_limit: Only include jobs posted within this time frame (e.g., "1d ago")
-            
+            job_url: URL of the job posting
+            max_attempts: Number of extraction attempts
+
         Returns:
-            List of dictionaries containing job details
+            Dictionary containing job details, or None if every attempt failed
         """
-        try:
-            print(f"Starting scrape with search URL: {search_url}")
-            
-            all_jobs_data = []
-            current_page = 1
-            jobs_scraped = 0
-            current_url = search_url
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing job: %s", job_url)
+
+        for detail_attempt in range(max_attempts):
+            try:
+                job_details = await self.extract_job_details(job_url)
+                if job_details:
+                    return job_details
+            except Exception as e:
+                logger.warning("Job detail attempt %d failed: %s", detail_attempt + 1, e)
+                await asyncio.sleep(2)
+
+        return None
+
+
+    def _extract_card_fields(self, card, job_url: str) -> Dict:
+        """
+        Build the job details from a search result card alone, without fetching the job page
+
+        Args:
+            card: LexborNode of the job card
+            job_url: URL of the job posting
+
+        Returns:
+            Dictionary with the same keys as extract_job_details, the description marked as not fetched
+        """
+        card_fields = {}
+        for key, selector, default in self.CARD_FIELDS:
+            element = card.css_first(selector)
+            card_fields[key] = self.sanitize_text(element.text().strip()) if element is not None else default
+
+        return {
+            'url': job_url,
+            'job_id': self.extract_job_id(job_url),
+            'job_title': card_fields['job_title'],
+            'company': card_fields['company'],
+            'job_description': "Description not fetched",
+            'job_location': card_fields['job_location'],
+            'posting_time': card_fields['posting_time'],
+            'job_type': self.categorize_job_type(card_fields['job_title'])
+        }
 
+    def _collect_job_urls(self, tree: LexborHTMLParser, posted_time_limit: Optional[str], seen_ids: set):
+        """
+        Collect the job URLs of the cards on a search results page
+
+        Args:
+            tree: LexborHTMLParser tree of the search results page
+            posted_time_limit: Only include jobs posted within this time frame (optional)
+            seen_ids: Job ids already collected, updated in place so a job is only fetched once per scrape
+
+        Returns:
+            Tuple of the new (job URL, card) pairs in page order and whether a card outside the time limit was reached
+        """
+        job_urls = []
+        for card in tree.css(self.JOB_CARDS_SELECTOR):
+            link_element = card.css_first(self.JOB_LINK_SELECTOR)
+            href = link_element.attributes.get('href') if link_element is not None else None
+            if not href:
+                continue
+
+            # The card's listing date is checked here so jobs outside the time limit are never fetched
+            if posted_time_limit and self._card_outside_time_limit(card, posted_time_limit):
+                return job_urls, True
+
+            job_url = self._absolute_url(href)
+            job_id = self.extract_job_id(job_url)
+            if job_id not in seen_ids:
+                seen_ids.add(job_id)
+                job_urls.append((job_url, card))
+
+        return job_urls, False
+
+    async def _paginate(self, search_url: str, url_queue: asyncio.Queue, num_workers: int, max_pages: int = None, posted_time_limit: str = None, fetch_description: bool = True, job_slots: Optional[asyncio.Semaphore] = None):
+        """
+        Producer: walk the search result pages and queue (position, job_url, card_details) for the detail
+        workers. card_details is None when the job page has to be fetched for the description.
+        One None sentinel per worker is queued once there are no more pages.
+        With num_jobs, job_slots holds one slot per job still wanted: every queued URL takes a slot and only
+        a failed job gives it back, so no more job pages (or search pages) are fetched than num_jobs needs.
+        """
+        position = 0
+        current_url = search_url
+        seen_ids = set()
+
+        # Seek paginates with the page query parameter, so the next page URLs are built from the
+        # search URL (parsed once) instead of looking up the pagination links in every page
+        search_parts = urlparse(search_url)
+        search_params = parse_qsl(search_parts.query, keep_blank_values=True)
+        search_query = [(key, value) for key, value in search_params if key != 'page']
+        previous_tree = None
+
+        # Start counting from the page the search URL points at, so a URL with page=3 continues with page 4
+        page_param = dict(search_params).get('page', '')
+        current_page = int(page_param) if page_param.isdigit() and int(page_param) > 0 else 1
+        first_page = current_page
+
+        # Search pages missing job cards are loaded in Selenium, but once a page had its cards in the
+        # static HTML the rest will too, and a page without cards is just past the last results page
+        sentinel = self.JOB_CARDS_SELECTOR
+
+        try:
             while True:
-                print(f"\nScraping page {current_page}")
-                
+                logger.info("Scraping page %d", current_page)
+
                 # Fetch the current page with retries
-                soup = await self.fetch_page(current_url, max_retries=3)
-                if not soup:
+                tree, rendered = await self._fetch_tree(current_url, max_retries=3, sentinel=sentinel)
+                if not tree:
                     break
-                
-                # Find all job cards
-                job_cards = soup.select('article[data-automation="normalJob"], [data-automation="jobCard"]')
-                print(f"Found {len(job_cards)} job cards on page {current_page}")
-
-                # Process each job card
-                for card in job_cards:
-                    if num_jobs and jobs_scraped >= num_jobs:
-                        return all_jobs_data
-
-                    try:
-                                              
-                        
-                        # Get the job link
-                        link_element = card.select_one('a')
-                        if not link_element or not link_element.has_attr('href'):
-                            continue
-
-                        href = link_element['href']
-                        job_url = urljoin(self.base_url, href)
-                        print(f"\nProcessing job {jobs_scraped + 1}: {job_url}")
-
-                        # Extract job details with retries
-                        job_details = None
-                        for detail_attempt in range(3):
-                            try:
-                                job_details = await self.extract_job_details(job_url)
-                                if job_details:
-                                    break
-                            except Exception as e:
-                                print(f"Job detail attempt {detail_attempt + 1} failed: {str(e)}")
-                                await asyncio.sleep(2)
-
-                        # Check if job meets criteria and add to results
-                        if job_details:
-                            if posted_time_limit and not self._is_within_time_limit(job_details['posting_time'], posted_time_limit):
-                                print(f"Job outside time limit, stopping scrape")
-                                return all_jobs_data
-
-                            all_jobs_data.append(job_details)
-                            jobs_scraped += 1
-                            print(f"Successfully scraped job {jobs_scraped}")
-                        
-                    except Exception as e:
-                        print(f"Error processing job card: {str(e)}")
+                if not rendered and tree.css_first(self.JOB_CARDS_SELECTOR) is not None:
+                    sentinel = None
+
+                job_urls, reached_time_limit = self._collect_job_urls(tree, posted_time_limit, seen_ids)
+
+                if not job_urls and not reached_time_limit:
+                    if previous_tree is not None and tree.css_first(self.JOB_CARDS_SELECTOR) is None:
+                        # The built URL has no results, so follow the previous page's pagination link if it has one
+                        fallback_url = await self.get_next_page_url(previous_tree, current_page - 1)
+                        previous_tree = None
+                        if not fallback_url or fallback_url == current_url:
+                            logger.info("No next page found, ending scrape")
+                            break
+                        current_url = fallback_url
                         continue
 
-                # Check if we've reached the maximum number of pages
-                if max_pages and current_page >= max_pages:
+                    # No cards, or only jobs already seen (Seek may serve the last page again for pages past the end)
+                    logger.info("No new jobs on page %d, ending scrape", current_page)
                     break
 
-                # Add a random delay between pages
-                await asyncio.sleep(random.uniform(2, 5))
+                logger.info("Found %d jobs on page %d", len(job_urls), current_page)
+
+                # Blocks while the queue is full, so pagination never runs far ahead of the workers
+                for job_url, card in job_urls:
+                    if job_slots is not None:
+                        await job_slots.acquire()
+                    card_details = None if fetch_description else self._extract_card_fields(card, job_url)
+                    await url_queue.put((position, job_url, card_details))
+                    position += 1
 
-                # Get the next page URL
-                next_page_url = await self.get_next_page_url(soup, current_page)
-                if not next_page_url:
-                    print("No next page found, ending scrape")
+                if reached_time_limit:
+                    logger.info("Job card outside time limit, stopping scrape")
                     break
 
-                current_url = next_page_url
+                # Check if we've reached the maximum number of pages
+                if max_pages and current_page - first_page + 1 >= max_pages:
+                    break
+
+                # Build the next page URL. The last page is detected by the next page coming back without job cards
                 current_page += 1
-                await asyncio.sleep(1)  # Small delay between pages to avoid rate limiting
+                previous_tree = tree
+                current_url = urlunparse(search_parts._replace(query=urlencode(search_query + [('page', current_page)])))
+
+        except Exception as e:
+            logger.error("Error while paginating: %s", e)
+
+        for _ in range(num_workers):
+            await url_queue.put(None)
+
+    async def _detail_worker(self, url_queue: asyncio.Queue, result_queue: asyncio.Queue):
+        """
+        Consumer: extract the details of queued job URLs, putting (position, job_details) on the
+        result queue, until the None sentinel arrives. The sentinel is passed on to the result queue.
+        Jobs that already come with their card details are passed on without fetching the job page.
+        """
+        while True:
+            item = await url_queue.get()
+            if item is None:
+                await result_queue.put(None)
+                return
+
+            position, job_url, card_details = item
+            if card_details is not None:
+                await result_queue.put((position, card_details))
+                continue
+
+            try:
+                job_details = await self._extract_with_retries(job_url)
+            except Exception as e:
+                logger.warning("Error processing job %s: %s", job_url, e)
+                job_details = None
+            await result_queue.put((position, job_details))
+
+    @staticmethod
+    async def _stop_pagination(paginator: asyncio.Task, url_queue: asyncio.Queue, num_workers: int):
+        """
+        Cancel the paginator, drop the job URLs nobody picked up yet and release the workers
+        """
+        paginator.cancel()
+        await asyncio.gather(paginator, return_exceptions=True)
+
+        while not url_queue.empty():
+            url_queue.get_nowait()
+        for _ in range(num_workers):
+            url_queue.put_nowait(None)
+
+
+    async def iter_jobs(self, search_url: str, num_jobs: int = None, max_pages: int = None, posted_time_limit: str = None, results_path: Optional[str] = None, fetch_description: bool = True) -> AsyncIterator[Dict]:
+        """
+        Scrape job listings from Seek, yielding each job in page order as soon as it is scraped
+
+        A paginator task queues job URLs while the next result pages are still being fetched,
+        and a pool of workers fetches the job details concurrently.
+        
+        Args:
+            search_url: Initial search URL
+            num_jobs: Maximum number of jobs to scrape (optional)
+            max_pages: Maximum number of pages to scrape (optional)
+            posted_time_limit: Only include jobs posted within this time frame (e.g., "1d ago")
+            results_path: JSONL file each job is appended to as soon as it is scraped (optional)
+            fetch_description: Fetch every job page for the description. When False the jobs are built
+                from the search result cards alone, one request per page instead of one per job
+            
+        Yields:
+            Dictionaries containing job details
+        """
+        logger.info("Starting scrape with search URL: %s", search_url)
+
+        jobs_scraped = 0
+        # No more workers than jobs wanted, so little is fetched past num_jobs
+        num_workers = min(self.concurrency, num_jobs) if num_jobs else self.concurrency
+        url_queue = asyncio.Queue(maxsize=min(num_workers * 2, num_jobs) if num_jobs else num_workers * 2)
+        result_queue = asyncio.Queue()
+
+        # Jobs queued or scraped at once never exceed num_jobs; a failed job frees its slot for the next URL
+        job_slots = asyncio.Semaphore(num_jobs) if num_jobs else None
+
+        paginator = asyncio.create_task(self._paginate(search_url, url_queue, num_workers, max_pages, posted_time_limit, fetch_description, job_slots))
+        workers = [asyncio.create_task(self._detail_worker(url_queue, result_queue)) for _ in range(num_workers)]
+
+        outside_time_limit = object() # Marks a job posted outside the time limit
+        resolved = {} # position -> job details that arrived ahead of an earlier position
+        next_position = 0
+        finished_workers = 0
+        stopping = False
 
-            return all_jobs_data
+        try:
+            while finished_workers < num_workers:
+                item = await result_queue.get()
+                if item is None:
+                    finished_workers += 1
+                    continue
+
+                position, job_details = item
+                if not job_details and job_slots is not None:
+                    job_slots.release()
+                if job_details and posted_time_limit and not self._is_within_time_limit(job_details['posting_time'], posted_time_limit):
+                    job_details = outside_time_limit
+                    if not stopping:
+                        stopping = True
+                        await self._stop_pagination(paginator, url_queue, num_workers)
+                resolved[position] = job_details
+
+                # Accept jobs in page order, so num_jobs and the time limit stop at the same job as a sequential scrape
+                while next_position in resolved:
+                    job_details = resolved.pop(next_position)
+                    next_position += 1
+
+                    if job_details is outside_time_limit:
+                        logger.info("Job outside time limit, stopping scrape")
+                        return
+
+                    if job_details:
+                        jobs_scraped += 1
+                        if results_path:
+                            await submit_write(results_path, orjson.dumps(job_details) + b'\n', append=True)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Successfully scraped job %d", jobs_scraped)
+                        yield job_details
+
+                        if num_jobs and jobs_scraped >= num_jobs:
+                            return
+
+        finally:
+            # Also runs when the consumer stops iterating early (e.g. a streaming client disconnects)
+            paginator.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(paginator, *workers, return_exceptions=True)
+
+    async def scrape_jobs(self, search_url: str, num_jobs: int = None, max_pages: int = None, posted_time_limit: str = None, results_path: Optional[str] = None, fetch_description: bool = True) -> List[Dict]:
+        """
+        Scrape job listings from Seek based on search criteria
+        
+        Args:
+            search_url: Initial search URL
+            num_jobs: Maximum number of jobs to scrape (optional)
+            max_pages: Maximum number of pages to scrape (optional)
+            posted_time_limit: Only include jobs posted within this time frame (e.g., "1d ago")
+            results_path: JSONL file each job is appended to as soon as it is scraped (optional)
+            fetch_description: Fetch every job page for the description (see iter_jobs)
+            
+        Returns:
+            List of dictionaries containing job details
+        """
+        try:
+            return [job_details async for job_details in self.iter_jobs(search_url, num_jobs, max_pages, posted_time_limit, results_path, fetch_description)]
 
         except Exception as e:
-            print(f"Error in scrape_jobs: {str(e)}")
+            logger.error("Error in scrape_jobs: %s", e)
             return []
 
     async def save_to_json(self, jobs_data: List[Dict], filename: str = 'seek_jobs_bs4.json'):
@@ -632,22 +1334,10 @@ class SeekScraper:
             jobs_data: List of job data dictionaries
             filename: Name of the output JSON file
         """
-        # Ensure all job details are fully resolved
-        scraped_jobs = []
-        for job in jobs_data:
-            # Create a new dict with resolved values
-            scraped_job = {}
-            for key, value in job.items():
-                if key in ['job_title', 'company','job_location', 'job_description', 'posting_time', 'job_type']:
-                    # Ensure these values are strings
-                    scraped_job[key] = self.sanitize_text(value)
-                else:
-                    scraped_job[key] = value
-            scraped_jobs.append(scraped_job)
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(scraped_jobs, f, ensure_ascii=False, indent=2)
-        print(f"\nSaved {len(scraped_jobs)} jobs to {filename}")
+        # extract_job_details already stores sanitized strings, so the jobs are written as they are.
+        # The writer task does the disk I/O so a slow disk doesn't block the event loop
+        await submit_write(filename, orjson.dumps(jobs_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        logger.info("Saved %d jobs to %s", len(jobs_data), filename)
 
 
 # Creates a directory to save the results if it doesnt exists
@@ -665,6 +1355,7 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "/scrape": "POST - Scrape jobs based on search criteria and return results",
+            "/scrape/stream": "POST - Scrape jobs and stream them back as NDJSON while scraping",
             "/health": "GET - Check API health status"
         }
     }
@@ -686,40 +1377,32 @@ async def scrape_jobs_endpoint(request: JobSearchRequest):
         
         start_time = time.time()    
 
+        # Jobs are streamed to a JSONL file while scraping so a crash doesn't lose them
+        run_id = f"job_{uuid.uuid4().hex}" # Unique even for scrapes started in the same millisecond
+        results_file = os.path.join(RESULTS_DIR, f"{run_id}_results.jsonl")
+
         # Run the scraper
-        async with SeekScraper(use_selenium=True) as scraper:
+        async with SeekScraper(use_selenium=True, max_rate=request.max_rate, session=app.state.session) as scraper:
             jobs_data = await scraper.scrape_jobs(
                 str(request.search_url),
                 num_jobs=request.num_jobs,
                 max_pages=request.max_pages,
-                posted_time_limit=request.posted_time_limit
-            
+                posted_time_limit=request.posted_time_limit,
+                results_path=results_file,
+                fetch_description=request.fetch_description
             )
 
         elapsed_time = time.time() - start_time
         
-        
-        # Ensure all values are properly serializable
-        serializable_jobs = []
-        for job in jobs_data:
-            serializable_job = {}
-            for key, value in job.items():
-                # Use sanitize_text for string values
-                if isinstance(value, str):
-                    serializable_job[key] = scraper.sanitize_text(value)
-                elif isinstance(value, (type, object)) and not isinstance(value, (int, float, bool, str, list, dict, type(None))):
-                    serializable_job[key] = str(value)
-                else:
-                    serializable_job[key] = value
-
-            serializable_jobs.append(serializable_job)
-        
-        return {
+        # Job details only hold sanitized strings, so the response is built directly instead of
+        # going through FastAPI's jsonable_encoder
+        return ORJSONResponse({
             "status": "success",
-            "job_count": len(serializable_jobs),
+            "job_count": len(jobs_data),
             "execution_time": round(elapsed_time, 2),
-            "data": serializable_jobs
-        }
+            "results_file": results_file,
+            "data": jobs_data
+        })
     
     except Exception as e:
         raise HTTPException(
@@ -728,10 +1411,40 @@ async def scrape_jobs_endpoint(request: JobSearchRequest):
         )
 
 
+#Streaming scrape endpoint
+@app.post("/scrape/stream")
+async def scrape_jobs_stream_endpoint(request: JobSearchRequest):
+    """
+    Endpoint to scrape jobs based on search criteria
+
+    Streams the jobs back as NDJSON (one JSON object per line) as soon as each one is scraped,
+    instead of holding the whole result set until the scrape ends
+    """
+    run_id = f"job_{uuid.uuid4().hex}"
+    results_file = os.path.join(RESULTS_DIR, f"{run_id}_results.jsonl")
+
+    async def stream_jobs():
+        async with SeekScraper(use_selenium=True, max_rate=request.max_rate, session=app.state.session) as scraper:
+            try:
+                async for job_details in scraper.iter_jobs(
+                    str(request.search_url),
+                    num_jobs=request.num_jobs,
+                    max_pages=request.max_pages,
+                    posted_time_limit=request.posted_time_limit,
+                    results_path=results_file,
+                    fetch_description=request.fetch_description
+                ):
+                    yield orjson.dumps(job_details) + b"\n"
+            except Exception as e:
+                # The response has already started, so the stream just ends early
+                logger.error("Error while streaming jobs: %s", e)
+
+    return StreamingResponse(stream_jobs(), media_type="application/x-ndjson", headers={"X-Results-File": results_file})
+
 
 if __name__ == "__main__":
     # Determine port - use environment variable if available
     port = int(os.environ.get("PORT", 8080))
     
-    # Run the API server
-    uvicorn.run("seek_scraper_BS_v7:app", host="0.0.0.0", port=port, reload=False)
+    # Run the API server on the libuv event loop and the C HTTP parser
+    uvicorn.run("seek_scraper_BS_v7:app", host="0.0.0.0", port=port, reload=False, loop="uvloop", http="httptools", log_level=logger.level)